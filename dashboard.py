@@ -3,6 +3,7 @@ CES'Event Donations Dashboard - Main Streamlit Application
 """
 
 import streamlit as st
+import pandas as pd
 import sys
 from pathlib import Path
 
@@ -23,10 +24,14 @@ from src.visualizations import (
     create_hourly_chart,
     create_top_donors_chart,
     create_donations_count_chart,
-    COLORS
+    format_currency,
+    DASHBOARD_CSS
 )
 
 
+DATA_FILE = "data/donations.json"
+
+
 # Page configuration
 st.set_page_config(
     page_title="CES'Event Donations Dashboard",
@@ -35,42 +40,63 @@ st.set_page_config(
     initial_sidebar_state="collapsed"
 )
 
-# Custom CSS for dark theme
-st.markdown(f"""
-    <style>
-        .stApp {{
-            background-color: {COLORS['background']};
-        }}
-        .stMetric {{
-            background-color: {COLORS['secondary_bg']};
-            padding: 15px;
-            border-radius: 10px;
-            border-left: 4px solid {COLORS['primary']};
-        }}
-        .stMetric label {{
-            color: {COLORS['text']} !important;
-            font-size: 1rem !important;
-        }}
-        .stMetric [data-testid="stMetricValue"] {{
-            color: {COLORS['primary']} !important;
-            font-size: 2rem !important;
-        }}
-        h1, h2, h3 {{
-            color: {COLORS['text']} !important;
-        }}
-        .metric-container {{
-            background-color: {COLORS['secondary_bg']};
-            padding: 20px;
-            border-radius: 10px;
-            margin: 10px 0;
-        }}
-    </style>
-""", unsafe_allow_html=True)
-
-
-def format_currency(amount: float) -> str:
-    """Format amount as currency."""
-    return f"{amount:,.2f}€".replace(',', ' ')
+# Custom CSS for dark theme (the string is built once at import; it must
+# still be emitted on every run, Streamlit clears elements a rerun skips)
+st.markdown(DASHBOARD_CSS, unsafe_allow_html=True)
+
+
+@st.cache_data(show_spinner=False)
+def _cached_load(file_path: str, mtime: float):
+    """
+    Load and clean donations once per version of the data file.
+
+    The file modification time is part of the cache key so that any update
+    to the JSON file invalidates the cached DataFrame on the next rerun.
+    """
+    return load_donations(file_path)
+
+
+@st.cache_data(show_spinner=False)
+def _cached_kpis(_df: pd.DataFrame, data_version: tuple) -> dict:
+    """
+    Compute all KPIs and aggregated data once per version of the data file.
+
+    The DataFrame is not hashed (leading underscore): data_version, the
+    (path, mtime) pair used by _cached_load, already identifies its contents.
+    """
+    return {
+        'main_kpis': calculate_main_kpis(_df),
+        'rate_per_hour': calculate_rate_per_hour(_df),
+        'data_summary': get_data_summary(_df),
+        'timeline_data': get_timeline_data(_df, freq='H'),
+        'hourly_data': get_hourly_donations(_df),
+        'top_donors': get_top_donors(_df, n=10)
+    }
+
+
+def _frame_content_hash(df: pd.DataFrame) -> bytes:
+    """Content hash of a DataFrame using pandas' vectorized row hasher."""
+    return pd.util.hash_pandas_object(df, index=True).values.tobytes()
+
+
+@st.cache_data(show_spinner=False)
+def _cached_amount_histogram(_df: pd.DataFrame, data_version: tuple):
+    """Build the amount histogram once per version of the data file."""
+    return create_amount_histogram(_df)
+
+
+# The other charts take small aggregated DataFrames, so hashing their
+# content is cheaper than rebuilding the figures
+_cache_by_content = st.cache_data(
+    show_spinner=False,
+    hash_funcs={pd.DataFrame: _frame_content_hash}
+)
+
+# Cached chart wrappers: reruns reuse the built Plotly figures
+_cached_timeline_chart = _cache_by_content(create_timeline_chart)
+_cached_donations_count_chart = _cache_by_content(create_donations_count_chart)
+_cached_hourly_chart = _cache_by_content(create_hourly_chart)
+_cached_top_donors_chart = _cache_by_content(create_top_donors_chart)
 
 
 def main():
@@ -82,7 +108,10 @@ def main():
 
     # Load data
     try:
-        df = load_donations("data/donations.json")
+        data_path = Path(DATA_FILE)
+        mtime = data_path.stat().st_mtime if data_path.exists() else None
+        df = _cached_load(DATA_FILE, mtime)
+        data_version = (DATA_FILE, mtime)
     except FileNotFoundError as e:
         st.error(f"Erreur: {str(e)}")
         st.info("Veuillez ajouter votre fichier donations.json dans le dossier data/")
@@ -92,9 +121,10 @@ def main():
         st.stop()
 
     # Calculate KPIs
-    main_kpis = calculate_main_kpis(df)
-    rate_per_hour = calculate_rate_per_hour(df)
-    data_summary = get_data_summary(df)
+    kpis = _cached_kpis(df, data_version)
+    main_kpis = kpis['main_kpis']
+    rate_per_hour = kpis['rate_per_hour']
+    data_summary = kpis['data_summary']
 
     # Display main KPIs in columns
     st.header("Indicateurs Clés")
@@ -141,16 +171,16 @@ def main():
     # Timeline section
     st.header("Évolution Temporelle")
 
-    timeline_data = get_timeline_data(df, freq='H')
+    timeline_data = kpis['timeline_data']
 
     col1, col2 = st.columns(2)
 
     with col1:
-        fig_timeline = create_timeline_chart(timeline_data)
+        fig_timeline = _cached_timeline_chart(timeline_data)
         st.plotly_chart(fig_timeline, use_container_width=True)
 
     with col2:
-        fig_count = create_donations_count_chart(timeline_data)
+        fig_count = _cached_donations_count_chart(timeline_data)
         st.plotly_chart(fig_count, use_container_width=True)
 
     st.markdown("---")
@@ -161,12 +191,12 @@ def main():
     col1, col2 = st.columns(2)
 
     with col1:
-        fig_histogram = create_amount_histogram(df)
+        fig_histogram = _cached_amount_histogram(df, data_version)
         st.plotly_chart(fig_histogram, use_container_width=True)
 
     with col2:
-        hourly_data = get_hourly_donations(df)
-        fig_hourly = create_hourly_chart(hourly_data)
+        hourly_data = kpis['hourly_data']
+        fig_hourly = _cached_hourly_chart(hourly_data)
         st.plotly_chart(fig_hourly, use_container_width=True)
 
     st.markdown("---")
@@ -174,19 +204,21 @@ def main():
     # Top donors section
     st.header("Top Donateurs")
 
-    top_donors = get_top_donors(df, n=10)
+    top_donors = kpis['top_donors']
 
     if len(top_donors) > 0:
         col1, col2 = st.columns([2, 1])
 
         with col1:
-            fig_top_donors = create_top_donors_chart(top_donors)
+            fig_top_donors = _cached_top_donors_chart(top_donors)
             st.plotly_chart(fig_top_donors, use_container_width=True)
 
         with col2:
             st.subheader("Tableau des Top Donateurs")
             display_top = top_donors.copy()
-            display_top['total_amount'] = display_top['total_amount'].apply(format_currency)
+            display_top['total_amount'] = [
+                format_currency(amount) for amount in display_top['total_amount'].to_numpy()
+            ]
             display_top.columns = ['Nom', 'Montant Total', 'Nb Donations']
             st.dataframe(display_top, use_container_width=True, hide_index=True)
     else:
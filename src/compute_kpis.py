@@ -2,10 +2,19 @@
 KPI calculation module for CES'Event donations
 """
 
+import numpy as np
 import pandas as pd
 from datetime import timedelta
 
 
+# Supported timeline frequencies mapped to NumPy datetime64 units
+TIMELINE_FREQUENCIES = {
+    'H': 'h',
+    'h': 'h',
+    'D': 'D'
+}
+
+
 def calculate_main_kpis(df: pd.DataFrame) -> dict:
     """
     Calculate main KPIs for the donations.
@@ -16,10 +25,21 @@ def calculate_main_kpis(df: pd.DataFrame) -> dict:
     Returns:
         Dictionary with main KPIs
     """
-    total_amount = df['amount'].sum()
-    total_donations = len(df)
-    mean_donation = df['amount'].mean()
-    median_donation = df['amount'].median()
+    # Extract the amounts once and reduce the NumPy array directly
+    amounts = df['amount'].to_numpy(dtype=np.float64)
+    total_donations = amounts.size
+
+    if total_donations == 0:
+        return {
+            'total_amount': 0.0,
+            'total_donations': 0,
+            'mean_donation': 0.0,
+            'median_donation': 0.0
+        }
+
+    total_amount = amounts.sum()
+    mean_donation = total_amount / total_donations
+    median_donation = _median(amounts)
 
     return {
         'total_amount': total_amount,
@@ -29,6 +49,25 @@ def calculate_main_kpis(df: pd.DataFrame) -> dict:
     }
 
 
+def _median(values: np.ndarray) -> float:
+    """
+    Compute the median with a linear-time selection instead of a full sort.
+
+    Args:
+        values: Non-empty 1D array
+
+    Returns:
+        Median value
+    """
+    mid = values.size // 2
+
+    if values.size % 2 == 1:
+        return np.partition(values, mid)[mid]
+
+    part = np.partition(values, [mid - 1, mid])
+    return (part[mid - 1] + part[mid]) / 2
+
+
 def calculate_rate_per_hour(df: pd.DataFrame) -> float:
     """
     Calculate the average amount collected per hour.
@@ -48,7 +87,7 @@ def calculate_rate_per_hour(df: pd.DataFrame) -> float:
     if hours == 0:
         return 0.0
 
-    total_amount = df['amount'].sum()
+    total_amount = df['amount'].to_numpy(dtype=np.float64).sum()
     return total_amount / hours
 
 
@@ -75,15 +114,26 @@ def get_hourly_donations(df: pd.DataFrame) -> pd.DataFrame:
         df: Donations DataFrame
 
     Returns:
-        DataFrame with hourly statistics
+        DataFrame with hourly statistics, one row per hour from 0 to 23
     """
-    hourly = df.groupby('hour').agg({
-        'amount': ['sum', 'count', 'mean']
+    # Hours are bounded ints in [0, 23]: bincount replaces the groupby.
+    # Donations without an hour (missing datetime) are left out.
+    has_hour = df['hour'].notna().to_numpy()
+    hours = df['hour'].to_numpy(dtype=np.int64, na_value=0)[has_hour]
+    amounts = df['amount'].to_numpy(dtype=np.float64)[has_hour]
+
+    total_amount = np.bincount(hours, weights=amounts, minlength=24)
+    donation_count = np.bincount(hours, minlength=24)
+    mean_amount = np.divide(total_amount, donation_count,
+                            out=np.zeros(24), where=donation_count > 0)
+
+    hourly = pd.DataFrame({
+        'hour': np.arange(24),
+        'total_amount': total_amount,
+        'donation_count': donation_count,
+        'mean_amount': mean_amount
     }).round(2)
 
-    hourly.columns = ['total_amount', 'donation_count', 'mean_amount']
-    hourly = hourly.reset_index()
-
     return hourly
 
 
@@ -104,15 +154,23 @@ def get_amount_distribution(df: pd.DataFrame, bins: list = None) -> pd.DataFrame
     labels = [f"{bins[i]}-{bins[i+1]}" if bins[i+1] != float('inf') else f"{bins[i]}+"
               for i in range(len(bins) - 1)]
 
-    df_copy = df.copy()
-    df_copy['amount_range'] = pd.cut(df_copy['amount'], bins=bins, labels=labels, include_lowest=True)
-
-    distribution = df_copy.groupby('amount_range', observed=True).agg({
-        'amount': ['count', 'sum']
-    }).round(2)
-
-    distribution.columns = ['donation_count', 'total_amount']
-    distribution = distribution.reset_index()
+    # Bins are sorted and right-closed (first one includes its lower edge):
+    # searchsorted on the upper edges gives each amount's bin index
+    amounts = df['amount'].to_numpy(dtype=np.float64)
+    edges = np.asarray(bins, dtype=np.float64)
+    amounts = amounts[(amounts >= edges[0]) & (amounts <= edges[-1])]
+    bin_ids = np.searchsorted(edges[1:], amounts, side='left')
+
+    donation_count = np.bincount(bin_ids, minlength=len(labels))
+    total_amount = np.bincount(bin_ids, weights=amounts, minlength=len(labels))
+
+    # Keep only ranges that contain donations
+    observed = donation_count > 0
+    distribution = pd.DataFrame({
+        'amount_range': pd.Categorical(np.asarray(labels)[observed], categories=labels),
+        'donation_count': donation_count[observed],
+        'total_amount': total_amount[observed].round(2)
+    })
 
     return distribution
 
@@ -128,22 +186,36 @@ def get_top_donors(df: pd.DataFrame, n: int = 10) -> pd.DataFrame:
     Returns:
         DataFrame with top donors
     """
-    # Filter donations with names
-    named_donations = df[df['name'].notna()].copy()
+    # Encode names as integer codes once (missing names get -1)
+    codes, names = pd.factorize(df['name'], use_na_sentinel=True)
+    named = codes >= 0
 
-    if len(named_donations) == 0:
+    if not named.any():
         return pd.DataFrame(columns=['name', 'total_amount', 'donation_count'])
 
-    # Group by name and aggregate
-    top_donors = named_donations.groupby('name').agg({
-        'amount': ['sum', 'count']
-    }).round(2)
-
-    top_donors.columns = ['total_amount', 'donation_count']
-    top_donors = top_donors.reset_index()
-
-    # Sort and get top n
-    top_donors = top_donors.sort_values('total_amount', ascending=False).head(n)
+    # Aggregate per donor code
+    codes = codes[named]
+    amounts = df['amount'].to_numpy(dtype=np.float64)[named]
+    total_amount = np.bincount(codes, weights=amounts, minlength=len(names))
+    donation_count = np.bincount(codes, minlength=len(names))
+
+    # Keep the donors at or above the n-th largest total without sorting
+    # every donor, then order them by total (ties in first-donation order,
+    # codes follow first appearance in the datetime-sorted data)
+    if n <= 0:
+        top = np.arange(0)
+    elif n < len(names):
+        threshold = np.partition(total_amount, len(names) - n)[len(names) - n]
+        top = np.flatnonzero(total_amount >= threshold)
+    else:
+        top = np.arange(len(names))
+    top = top[np.lexsort((top, -total_amount[top]))][:n]
+
+    top_donors = pd.DataFrame({
+        'name': names[top],
+        'total_amount': total_amount[top].round(2),
+        'donation_count': donation_count[top]
+    })
 
     return top_donors
 
@@ -154,17 +226,44 @@ def get_timeline_data(df: pd.DataFrame, freq: str = 'H') -> pd.DataFrame:
 
     Args:
         df: Donations DataFrame
-        freq: Frequency for resampling ('H' for hourly, 'D' for daily)
+        freq: Frequency of the time buckets ('H' for hourly, 'D' for daily)
 
     Returns:
-        DataFrame with timeline data
+        DataFrame with timeline data, one row per bucket between the first
+        and last donation (empty buckets included)
     """
-    timeline = df.set_index('datetime')[['amount', 'donation_number']].resample(freq).agg({
-        'amount': 'sum',
-        'donation_number': 'count'
+    unit = TIMELINE_FREQUENCIES.get(freq)
+    if unit is None:
+        raise ValueError(
+            f"Unsupported frequency '{freq}'. Use one of: {', '.join(TIMELINE_FREQUENCIES)}"
+        )
+
+    # Truncate timestamps to the bucket unit, skipping donations without a
+    # datetime (NaT) like resample does
+    buckets = df['datetime'].to_numpy().astype(f'datetime64[{unit}]')
+    dated = ~np.isnat(buckets)
+    buckets = buckets[dated]
+
+    if buckets.size == 0:
+        return pd.DataFrame(columns=['datetime', 'amount', 'donation_number',
+                                     'cumulative_amount', 'cumulative_count'])
+
+    # Use the offset from the first bucket as a bincount key (same buckets
+    # as resample)
+    first_bucket = buckets.min()
+    offsets = (buckets - first_bucket).astype(np.int64)
+    n_buckets = offsets.max() + 1
+
+    amount = np.bincount(offsets, weights=df['amount'].to_numpy(dtype=np.float64)[dated],
+                         minlength=n_buckets)
+    donation_number = np.bincount(offsets, minlength=n_buckets)
+
+    timeline = pd.DataFrame({
+        'datetime': (first_bucket + np.arange(n_buckets)).astype('datetime64[ns]'),
+        'amount': amount,
+        'donation_number': donation_number,
+        'cumulative_amount': amount.cumsum(),
+        'cumulative_count': donation_number.cumsum()
     })
 
-    timeline['cumulative_amount'] = timeline['amount'].cumsum()
-    timeline['cumulative_count'] = timeline['donation_number'].cumsum()
-
-    return timeline.reset_index()
+    return timeline
@@ -2,16 +2,32 @@
 Data loading and cleaning module for CES'Event donations
 """
 
-import json
+import hashlib
+import os
+import numpy as np
+import orjson
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 from datetime import datetime
 from pathlib import Path
 
 
+# Parquet metadata key holding the sidecar's source fingerprint
+CACHE_METADATA_KEY = b'cesevent_source'
+
+# Digest of this module, so changes to the cleaning code invalidate sidecars
+_LOADER_DIGEST = hashlib.sha256(Path(__file__).read_bytes()).hexdigest()
+
+
 def load_donations(file_path: str = "data/donations.json") -> pd.DataFrame:
     """
     Load donations data from JSON file and convert to DataFrame.
 
+    The cleaned DataFrame is saved as a Parquet file next to the JSON file
+    and loaded from there as long as the JSON file (size and modification
+    time), the cleaning code and the pandas/pyarrow versions are unchanged.
+
     Args:
         file_path: Path to the donations JSON file
 
@@ -24,9 +40,26 @@ def load_donations(file_path: str = "data/donations.json") -> pd.DataFrame:
             f"File {file_path} not found. Please add your donations.json file to the data/ directory."
         )
 
-    # Load JSON data
-    with open(file_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    # Reuse the cleaned Parquet sidecar when it was built from this exact
+    # JSON file; a stale or unreadable sidecar is rebuilt from the JSON file.
+    # The fingerprint is taken before parsing so that a file replaced while
+    # it is being read is never stamped as up to date.
+    cache_path = Path(file_path).with_suffix('.parquet')
+    fingerprint = _cache_fingerprint(Path(file_path))
+    try:
+        if pq.read_schema(cache_path).metadata.get(CACHE_METADATA_KEY) == fingerprint:
+            df = pd.read_parquet(cache_path)
+            # pandas restores Arrow strings as StringDtype; keep the ArrowDtype
+            # produced by clean_donations
+            if 'name' in df.columns:
+                df['name'] = df['name'].astype(pd.ArrowDtype(pa.string()))
+            return df
+    except Exception:
+        pass
+
+    # Load JSON data (orjson parses raw UTF-8 bytes)
+    with open(file_path, 'rb') as f:
+        data = orjson.loads(f.read())
 
     # Convert to DataFrame
     df = pd.DataFrame(data)
@@ -34,9 +67,63 @@ def load_donations(file_path: str = "data/donations.json") -> pd.DataFrame:
     # Clean and transform data
     df = clean_donations(df)
 
+    # Save the cleaned data for the next cold start (best effort)
+    _write_cache(df, cache_path, fingerprint)
+
     return df
 
 
+def _write_cache(df: pd.DataFrame, cache_path: Path, fingerprint: bytes) -> None:
+    """
+    Write the Parquet sidecar without ever failing the load.
+
+    The file is written under a temporary name and moved into place, so an
+    interrupted write never leaves a truncated sidecar behind.
+
+    Args:
+        df: Cleaned donations DataFrame
+        cache_path: Path to the Parquet sidecar
+        fingerprint: Source fingerprint stored in the file metadata
+    """
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+
+    try:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        table = table.replace_schema_metadata({
+            **(table.schema.metadata or {}),
+            CACHE_METADATA_KEY: fingerprint
+        })
+        pq.write_table(table, tmp_path, compression='zstd')
+        os.replace(tmp_path, cache_path)
+    except Exception:
+        # e.g. read-only directory, full disk or columns Arrow cannot store
+        tmp_path.unlink(missing_ok=True)
+
+
+def _cache_fingerprint(source_path: Path) -> bytes:
+    """
+    Describe everything the cleaned sidecar depends on.
+
+    The sidecar is only reused when this matches exactly, so it is rebuilt
+    whenever the JSON file is replaced (even by an older file), the cleaning
+    code in this module changes, or pandas/pyarrow are upgraded.
+
+    Args:
+        source_path: Path to the source JSON file
+
+    Returns:
+        Fingerprint as JSON bytes
+    """
+    stat = source_path.stat()
+    return orjson.dumps({
+        'source_mtime_ns': stat.st_mtime_ns,
+        'source_size': stat.st_size,
+        'loader_digest': _LOADER_DIGEST,
+        'pandas': pd.__version__,
+        'pyarrow': pa.__version__
+    })
+
+
 def clean_donations(df: pd.DataFrame) -> pd.DataFrame:
     """
     Clean and transform the donations DataFrame.
@@ -50,16 +137,25 @@ def clean_donations(df: pd.DataFrame) -> pd.DataFrame:
     # Make a copy to avoid modifying the original
     df = df.copy()
 
-    # Convert amount to float, handling empty strings
-    df['amount'] = pd.to_numeric(df['amount'], errors='coerce').fillna(0.0)
+    # Convert amount to float, handling empty strings. Amounts are euros with
+    # cents, so float32 is precise enough and halves the column size;
+    # reductions cast back to float64.
+    df['amount'] = pd.to_numeric(df['amount'], errors='coerce').fillna(0.0).astype(pd.ArrowDtype(pa.float32()))
+
+    # Store donor names as Arrow strings for faster grouping and null checks
+    # (non-string names, e.g. numbers, are converted to text first)
+    if 'name' in df.columns:
+        names = df['name']
+        df['name'] = names.where(names.isna(), names.astype(str)).astype(pd.ArrowDtype(pa.string()))
 
     # Convert timestamp (milliseconds) to datetime
     df['datetime'] = pd.to_datetime(df['timestamp'], unit='ms')
 
-    # Extract date and hour
-    df['date'] = df['datetime'].dt.date
-    df['hour'] = df['datetime'].dt.hour
-    df['day_name'] = df['datetime'].dt.day_name()
+    # Extract hour of day with integer arithmetic on hour-truncated timestamps
+    # (missing datetimes get a null hour)
+    hours_since_epoch = df['datetime'].to_numpy().astype('datetime64[h]')
+    hour = (hours_since_epoch.astype(np.int64) % 24).astype(np.int8)
+    df['hour'] = pd.arrays.ArrowExtensionArray(pa.array(hour, mask=np.isnat(hours_since_epoch)))
 
     # Filter out zero or negative amounts
     df = df[df['amount'] > 0].copy()
@@ -67,12 +163,6 @@ def clean_donations(df: pd.DataFrame) -> pd.DataFrame:
     # Sort by datetime
     df = df.sort_values('datetime').reset_index(drop=True)
 
-    # Add cumulative amount
-    df['cumulative_amount'] = df['amount'].cumsum()
-
-    # Add donation number
-    df['donation_number'] = range(1, len(df) + 1)
-
     return df
 
 
@@ -92,7 +182,7 @@ def get_data_summary(df: pd.DataFrame) -> dict:
             'start': df['datetime'].min(),
             'end': df['datetime'].max()
         },
-        'total_amount': df['amount'].sum(),
+        'total_amount': df['amount'].to_numpy(dtype=np.float64).sum(),
         'verified_count': df['verified'].sum(),
         'unverified_count': (~df['verified']).sum()
     }
@@ -2,6 +2,8 @@
 Visualization functions using Plotly for CES'Event donations
 """
 
+from functools import lru_cache
+
 import plotly.graph_objects as go
 import plotly.express as px
 import pandas as pd
@@ -33,6 +35,61 @@ LAYOUT_TEMPLATE = {
 }
 
 
+# Dark theme CSS injected by the dashboard
+DASHBOARD_CSS = f"""
+    <style>
+        .stApp {{
+            background-color: {COLORS['background']};
+        }}
+        .stMetric {{
+            background-color: {COLORS['secondary_bg']};
+            padding: 15px;
+            border-radius: 10px;
+            border-left: 4px solid {COLORS['primary']};
+        }}
+        .stMetric label {{
+            color: {COLORS['text']} !important;
+            font-size: 1rem !important;
+        }}
+        .stMetric [data-testid="stMetricValue"] {{
+            color: {COLORS['primary']} !important;
+            font-size: 2rem !important;
+        }}
+        h1, h2, h3 {{
+            color: {COLORS['text']} !important;
+        }}
+        .metric-container {{
+            background-color: {COLORS['secondary_bg']};
+            padding: 20px;
+            border-radius: 10px;
+            margin: 10px 0;
+        }}
+    </style>
+"""
+
+
+@lru_cache(maxsize=1024)
+def _format_cents(amount: float) -> str:
+    """Format an amount already rounded to cents."""
+    return f"{amount:,.2f}€".replace(',', ' ')
+
+
+def format_currency(amount: float) -> str:
+    """
+    Format amount as currency.
+
+    Results are memoized on the amount rounded to cents, since the same
+    values are displayed again on every Streamlit rerun.
+
+    Args:
+        amount: Amount in euros
+
+    Returns:
+        Formatted string, e.g. "1 234.50€"
+    """
+    return _format_cents(round(float(amount), 2))
+
+
 def create_timeline_chart(timeline_df: pd.DataFrame) -> go.Figure:
     """
     Create cumulative timeline chart for donations.
@@ -272,7 +329,7 @@ def create_top_donors_chart(top_donors_df: pd.DataFrame) -> go.Figure:
         y=top_donors_df['name'],
         x=top_donors_df['total_amount'],
         orientation='h',
-        text=top_donors_df['total_amount'].apply(lambda x: f"{x:.2f}€"),
+        text=[f"{amount:.2f}€" for amount in top_donors_df['total_amount'].to_numpy()],
         textposition='auto',
         marker_color=COLORS['primary'],
         hovertemplate='<b>%{y}</b><br>Montant: %{x:.2f}€<br>Donations: %{customdata}<extra></extra>',